@@ -1,53 +1,176 @@
 """RunPod cloud adaptor."""
 
+import http.cookiejar
+import json as json_lib
 import os
+import sys
+import threading
 import time
-from typing import Any, Dict, Optional
+import typing
+from typing import Any, Dict, Optional, Tuple
 
 from sky.adaptors import common
+from sky.utils import annotations
+
+if typing.TYPE_CHECKING:
+    import requests
+else:
+    requests = common.LazyImport('requests')
 
 runpod = common.LazyImport(
     'runpod',
     import_error_message='Failed to import dependencies for RunPod. '
     'Try running: pip install "skypilot[runpod]"')
+# tomllib is in the standard library from Python 3.11; older versions use
+# tomli, which the runpod SDK depends on.
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    tomllib = common.LazyImport('tomli')
+
+# Same file and profile the runpod SDK reads runpod.api_key from.
+_CREDENTIAL_FILE = '~/.runpod/config.toml'
+_CREDENTIAL_PROFILE = 'default'
 
-# Lazy imports
-requests = common.LazyImport('requests')
+# Credential file path -> ((st_ino, st_mtime_ns, st_ctime_ns, st_size),
+# api key), so the file is only re-parsed after it changes. The inode and
+# ctime catch a key rotated to one of the same length within the mtime
+# granularity, e.g. by `runpod config --overwrite` or an atomic rename.
+_credential_cache: Dict[str, Tuple[Tuple[int, int, int, int],
+                                   Optional[str]]] = {}
 
 _REST_BASE = 'https://rest.runpod.io/v1'
+_GRAPHQL_BASE = 'https://api.runpod.io'
 _MAX_RETRIES = 3
 _TIMEOUT = 10
+_GRAPHQL_TIMEOUT = 30
+
+# Pooled HTTP session shared by all API keys, so that REST/GraphQL calls
+# reuse keep-alive connections instead of doing a TLS handshake per request.
+# The Authorization header is passed per request.
+_session: Optional['requests.Session'] = None
+_session_lock = threading.Lock()
+
+# Query -> encoded request body, for queries registered by constant_query().
+_constant_query_bodies: Dict[str, bytes] = {}
+
+
+def _load_api_key_from_file() -> Optional[str]:
+    """Reads the API key from the RunPod credential file.
+
+    The file is parsed directly instead of reading runpod.api_key, because
+    importing the runpod SDK takes seconds and REST/GraphQL calls made
+    through this adaptor do not need it. The result is cached until the
+    file is replaced or modified.
+    """
+    path = os.path.expanduser(_CREDENTIAL_FILE)
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    version = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    cached = _credential_cache.get(path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+
+    api_key = None
+    try:
+        with open(path, 'rb') as f:
+            config = tomllib.loads(f.read().decode('utf-8'))
+    except FileNotFoundError:
+        return None
+    except ValueError:
+        config = {}
+    profile = config.get(_CREDENTIAL_PROFILE)
+    if isinstance(profile, dict):
+        api_key = profile.get('api_key')
+    _credential_cache[path] = (version, api_key)
+    return api_key
 
 
 def _get_api_key() -> str:
-    api_key = getattr(runpod, 'api_key', None)
+    api_key = _load_api_key_from_file()
     if not api_key:
-        # Fallback to env if SDK global not set
+        # Fallback to env if the credential file is not set up
         api_key = os.environ.get('RUNPOD_API_KEY')
     if not api_key:
         raise RuntimeError(
-            'RunPod API key is not set. Please set runpod.api_key '
-            'or RUNPOD_API_KEY.')
+            'RunPod API key is not set. Please run `runpod config` '
+            'or set RUNPOD_API_KEY.')
     return str(api_key)
 
 
+def sdk() -> Any:
+    """Returns the runpod SDK, using the same API key as this adaptor.
+
+    The SDK reads its credential file once, at import, into runpod.api_key.
+    This adaptor re-reads the file when it changes. Syncing the key before
+    each SDK call keeps SDK calls and rest_request/run_graphql_query on one
+    key, e.g. after `runpod config --overwrite` on a long-running API server.
+    """
+    runpod.load_module().api_key = _get_api_key()
+    return runpod
+
+
+@annotations.lru_cache(scope='global', maxsize=16)
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    # Built once per key rather than on every request. requests merges these
+    # into a new dict, so the cached one is never mutated.
+    return {'Authorization': f'Bearer {api_key}'}
+
+
+def _graphql_body(query: str) -> bytes:
+    return json_lib.dumps({'query': query}).encode('utf-8')
+
+
+def constant_query(query: str) -> str:
+    """Registers a fixed GraphQL query and returns it unchanged.
+
+    Meant for module-level query constants, e.g. the pod listing polled
+    while waiting for instances: their request bodies are encoded once here
+    and reused by run_graphql_query. Other queries, such as one-off
+    mutations, are encoded per call.
+    """
+    _constant_query_bodies[query] = _graphql_body(query)
+    return query
+
+
+def _get_session() -> 'requests.Session':
+    global _session
+    if _session is not None:
+        return _session
+    with _session_lock:
+        if _session is None:
+            session = requests.Session()
+            # Retries are handled by the callers.
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16,
+                                                    pool_maxsize=64,
+                                                    max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            session.headers['Content-Type'] = 'application/json'
+            # The session is shared by all API keys, so never store cookies:
+            # one set for a key would be replayed on requests for the others.
+            session.cookies.set_policy(
+                http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+            _session = session
+        return _session
+
+
 def rest_request(method: str,
                  path: str,
                  json: Optional[Dict[str, Any]] = None) -> Any:
     url = f'{_REST_BASE}{path}'
-    headers = {
-        'Authorization': f'Bearer {_get_api_key()}',
-        'Content-Type': 'application/json',
-    }
+    headers = _auth_headers(_get_api_key())
     attempt = 0
     while True:
         attempt += 1
         try:
-            resp = requests.request(method,
-                                    url,
-                                    headers=headers,
-                                    json=json,
-                                    timeout=_TIMEOUT)
+            resp = _get_session().request(method,
+                                          url,
+                                          headers=headers,
+                                          json=json,
+                                          timeout=_TIMEOUT)
         except Exception as e:  # pylint: disable=broad-except
             # Retry on transient network errors
             if attempt >= _MAX_RETRIES:
@@ -68,9 +191,35 @@ def rest_request(method: str,
             raise RuntimeError(
                 f'RunPod REST error {resp.status_code}: {resp.text}')
 
-        if resp.text:
+        # Check the raw body: resp.text would decode it to a str only for
+        # resp.json() to decode it again.
+        if resp.content:
             try:
                 return resp.json()
             except Exception:  # pylint: disable=broad-except
                 return resp.text
         return None
+
+
+def run_graphql_query(query: str) -> Dict[str, Any]:
+    """Runs a GraphQL query against the RunPod API.
+
+    Same semantics as runpod.api.graphql.run_graphql_query, but reuses the
+    pooled session of this adaptor.
+    """
+    headers = _auth_headers(_get_api_key())
+    base = os.environ.get('RUNPOD_API_BASE_URL', _GRAPHQL_BASE)
+    body = _constant_query_bodies.get(query)
+    if body is None:
+        body = _graphql_body(query)
+    resp = _get_session().post(f'{base}/graphql',
+                               headers=headers,
+                               data=body,
+                               timeout=_GRAPHQL_TIMEOUT)
+    if resp.status_code == 401:
+        raise runpod.error.AuthenticationError(
+            'Unauthorized request, please check your API key.')
+    result = resp.json()
+    if 'errors' in result:
+        raise runpod.error.QueryError(result['errors'][0]['message'], query)
+    return result
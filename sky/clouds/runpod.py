@@ -319,7 +319,12 @@ class RunPod(clouds.Cloud):
     def _check_runpod_credentials(cls, profile: str = 'default'):
         """Checks if the credentials file exists and is valid."""
         credential_file = os.path.expanduser(f'~/.runpod/{_CREDENTIAL_FILE}')
-        if not os.path.exists(credential_file):
+        # Read the file directly rather than probing it with os.path.exists()
+        # first, which costs an extra stat() per check.
+        try:
+            with open(credential_file, 'rb') as cred_file:
+                content = cred_file.read()
+        except FileNotFoundError:
             return False, '~/.runpod/config.toml does not exist.'
 
         # we don't need to import toml here if config.toml does not exist,
@@ -328,8 +333,7 @@ class RunPod(clouds.Cloud):
 
         # Check for default api_key
         try:
-            with open(credential_file, 'rb') as cred_file:
-                config = toml.load(cred_file)
+            config = toml.loads(content.decode('utf-8'))
 
             if profile not in config:
                 return False, (
@@ -70,17 +70,18 @@ def create_spot_pod(
                 bid_per_gpu=0.3
             )
     """
-    runpod.runpod.get_gpu(gpu_type_id)
+    runpod.sdk().get_gpu(gpu_type_id)
     # refer to https://graphql-spec.runpod.io/#definition-CloudTypeEnum
     if cloud_type not in ['ALL', 'COMMUNITY', 'SECURE']:
         raise ValueError('cloud_type must be one of ALL, COMMUNITY or SECURE')
 
     if network_volume_id and data_center_id is None:
-        user_info = runpod.runpod.get_user()
-        for network_volume in user_info['networkVolumes']:
-            if network_volume['id'] == network_volume_id:
-                data_center_id = network_volume['dataCenterId']
-                break
+        # Look up only the attached volume rather than listing all the
+        # user's volumes via runpod.get_user().
+        network_volume = runpod.rest_request(
+            'GET', f'/networkvolumes/{network_volume_id}')
+        if isinstance(network_volume, dict):
+            data_center_id = network_volume.get('dataCenterId')
 
     if container_disk_in_gb is None and template_id is None:
         container_disk_in_gb = 10
@@ -115,5 +116,5 @@ def create_spot_pod(
         template_id=template_id,
         volume_key=volume_key,
     )
-    response = runpod.runpod.api.graphql.run_graphql_query(mutation)
+    response = runpod.run_graphql_query(mutation)
     return response[_RESPONSE_DATA_FIELD][_INTERRUPTABLE_POD_FIELD]
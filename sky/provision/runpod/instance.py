@@ -10,7 +10,14 @@ from sky.utils import resources_utils
 from sky.utils import status_lib
 from sky.utils import ux_utils
 
-POLL_INTERVAL = 5
+# Pods usually come up within a minute, so poll often at first and back off
+# up to 2 * 8 = 16 seconds between queries after that. Backoff adds +/-40%
+# jitter on top of the cap, so a single sleep can last up to ~22 seconds.
+POLL_INITIAL_BACKOFF_SECONDS = 2
+POLL_MAX_BACKOFF_FACTOR = 8
+# Once a pod is RUNNING its SSH port is assigned within seconds, so keep the
+# readiness poll tight: at most 2 * 2 = 4 seconds (~5.6 seconds with jitter).
+SSH_READY_MAX_BACKOFF_FACTOR = 2
 QUERY_PORTS_TIMEOUT_SECONDS = 30
 
 logger = sky_logging.init_logger(__name__)
@@ -50,12 +57,14 @@ def run_instances(region: str, cluster_name_on_cloud: str,
 
     pending_status = ['CREATED', 'RESTARTING']
 
+    backoff = common_utils.Backoff(initial_backoff=POLL_INITIAL_BACKOFF_SECONDS,
+                                   max_backoff_factor=POLL_MAX_BACKOFF_FACTOR)
     while True:
         instances = _filter_instances(cluster_name_on_cloud, pending_status)
         if not instances:
             break
         logger.info(f'Waiting for {len(instances)} instances to be ready.')
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
     exist_instances = _filter_instances(cluster_name_on_cloud, ['RUNNING'])
     head_instance_id = _get_head_instance_id(exist_instances)
 
@@ -124,6 +133,9 @@ def run_instances(region: str, cluster_name_on_cloud: str,
             head_instance_id = instance_id
 
     # Wait for instances to be ready.
+    backoff = common_utils.Backoff(
+        initial_backoff=POLL_INITIAL_BACKOFF_SECONDS,
+        max_backoff_factor=SSH_READY_MAX_BACKOFF_FACTOR)
     while True:
         instances = _filter_instances(cluster_name_on_cloud, ['RUNNING'])
         ready_instance_cnt = 0
@@ -135,7 +147,7 @@ def run_instances(region: str, cluster_name_on_cloud: str,
         if ready_instance_cnt == config.count:
             break
 
-        time.sleep(POLL_INTERVAL)
+        time.sleep(backoff.current_backoff())
     assert head_instance_id is not None, 'head_instance_id should not be None'
     return common.ProvisionRecord(
         provider_name='runpod',
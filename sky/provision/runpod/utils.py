@@ -1,7 +1,6 @@
 """RunPod library wrapper for SkyPilot."""
 
 import base64
-import time
 from typing import Any, Dict, List, Optional, Tuple
 
 from sky import sky_logging
@@ -9,7 +8,6 @@ from sky.adaptors import runpod
 from sky.provision import docker_utils
 from sky.provision.runpod.api import commands as runpod_commands
 from sky.skylet import constants
-from sky.utils import common_utils
 
 logger = sky_logging.init_logger(__name__)
 
@@ -79,28 +77,9 @@ def _construct_docker_login_template_name(cluster_name: str) -> str:
     return f'{cluster_name}-docker-login-template'
 
 
-def retry(func):
-    """Decorator to retry a function."""
-
-    def wrapper(*args, **kwargs):
-        """Wrapper for retrying a function."""
-        cnt = 0
-        while True:
-            try:
-                return func(*args, **kwargs)
-            except runpod.runpod.error.QueryError as e:
-                if cnt >= 3:
-                    raise
-                logger.warning('Retrying for exception: '
-                               f'{common_utils.format_exception(e)}.')
-                time.sleep(1)
-
-    return wrapper
-
-
 # Adapted from runpod.api.queries.pods.py::QUERY_POD.
 # Adding containerRegistryAuthId to the query.
-_QUERY_POD = """
+_QUERY_POD = runpod.constant_query("""
 query myPods {
     myself {
         pods {
@@ -140,7 +119,7 @@ query myPods {
         }
     }
 }
-"""
+""")
 
 
 def _sky_get_pods() -> dict:
@@ -148,12 +127,12 @@ def _sky_get_pods() -> dict:
 
     Adapted from runpod.get_pods() to include containerRegistryAuthId.
     """
-    raw_return = runpod.runpod.api.graphql.run_graphql_query(_QUERY_POD)
+    raw_return = runpod.run_graphql_query(_QUERY_POD)
     cleaned_return = raw_return['data']['myself']['pods']
     return cleaned_return
 
 
-_QUERY_POD_TEMPLATE_WITH_REGISTRY_AUTH = """
+_QUERY_POD_TEMPLATE_WITH_REGISTRY_AUTH = runpod.constant_query("""
 query myself {
     myself {
         podTemplates {
@@ -162,12 +141,12 @@ query myself {
         }
     }
 }
-"""
+""")
 
 
 def _list_pod_templates_with_container_registry() -> dict:
     """List all pod templates."""
-    raw_return = runpod.runpod.api.graphql.run_graphql_query(
+    raw_return = runpod.run_graphql_query(
         _QUERY_POD_TEMPLATE_WITH_REGISTRY_AUTH)
     return raw_return['data']['myself']['podTemplates']
 
@@ -209,7 +188,7 @@ def list_instances() -> Dict[str, Dict[str, Any]]:
 def delete_pod_template(template_name: str) -> None:
     """Deletes a pod template."""
     try:
-        runpod.runpod.api.graphql.run_graphql_query(
+        runpod.run_graphql_query(
             f'mutation {{deleteTemplate(templateName: "{template_name}")}}')
     except runpod.runpod.error.QueryError as e:
         logger.warning(f'Failed to delete template {template_name}: {e} '
@@ -219,7 +198,7 @@ def delete_pod_template(template_name: str) -> None:
 def delete_register_auth(registry_auth_id: str) -> None:
     """Deletes a registry auth."""
     try:
-        runpod.runpod.delete_container_registry_auth(registry_auth_id)
+        runpod.sdk().delete_container_registry_auth(registry_auth_id)
     except runpod.runpod.error.QueryError as e:
         logger.warning(
             f'Failed to delete registry auth {registry_auth_id}: {e} '
@@ -249,13 +228,13 @@ def _create_template_for_docker_login(
     # TODO(tian): Now we create a template and a registry auth for each cluster.
     # Consider create one for each server and reuse them. Challenges including
     # calculate the reference count and delete them when no longer needed.
-    create_auth_resp = runpod.runpod.create_container_registry_auth(
+    create_auth_resp = runpod.sdk().create_container_registry_auth(
         name=container_registry_auth_name,
         username=login_config.username,
         password=login_config.password,
     )
     registry_auth_id = create_auth_resp['id']
-    create_template_resp = runpod.runpod.create_template(
+    create_template_resp = runpod.sdk().create_template(
         name=container_template_name,
         image_name=None,
         registry_auth_id=registry_auth_id,
@@ -367,7 +346,7 @@ def launch(
         gpu_type = GPU_NAME_MAP[instance_type.split('_')[1]]
         gpu_quantity = int(instance_type.split('_')[0].replace('x', ''))
         cloud_type = instance_type.split('_')[2]
-        gpu_specs = runpod.runpod.get_gpu(gpu_type)
+        gpu_specs = runpod.sdk().get_gpu(gpu_type)
         params.update({
             'gpu_type_id': gpu_type,
             'cloud_type': cloud_type,
@@ -377,7 +356,7 @@ def launch(
         })
 
     if preemptible is None or not preemptible:
-        new_instance = runpod.runpod.create_pod(**params)
+        new_instance = runpod.sdk().create_pod(**params)
     else:
         new_instance = runpod_commands.create_spot_pod(
             bid_per_gpu=bid_per_gpu,
@@ -401,7 +380,10 @@ def get_registry_auth_resources(
 
 def remove(instance_id: str) -> None:
     """Terminates the given instance."""
-    runpod.runpod.terminate_pod(instance_id)
+    # Same mutation as runpod.terminate_pod(), sent through the adaptor so the
+    # response is parsed once instead of three times by the SDK.
+    runpod.run_graphql_query(
+        f'mutation {{podTerminate(input: {{podId: "{instance_id}"}})}}')
 
 
 def get_ssh_ports(cluster_name) -> List[int]:
@@ -103,41 +103,35 @@ def _try_resolve_volume_id(name_on_cloud: str) -> Optional[str]:
     return None
 
 
-def get_volume_usedby(
-    config: models.VolumeConfig,) -> Tuple[List[str], List[str]]:
-    """Gets the clusters currently using this RunPod network volume.
+_QUERY_PODS_NETWORK_VOLUME = runpod.constant_query("""
+query Pods {
+  myself {
+    pods {
+      id
+      name
+      networkVolumeId
+    }
+  }
+}
+""")
 
-    Returns:
-      (usedby_pods, usedby_clusters)
-    usedby_clusters contains SkyPilot cluster display names inferred from
-      pod names, which may be wrong.
-    """
-    vol_id = config.id_on_cloud
-    name_on_cloud = config.name_on_cloud
-    if vol_id is None:
-        vol_id = _try_resolve_volume_id(name_on_cloud)
-    if vol_id is None:
-        return [], []
 
-    # Query all pods for current user and filter by networkVolumeId
-    query = """
-    query Pods {
-      myself {
-        pods {
-          id
-          name
-          networkVolumeId
-        }
-      }
-    }
-    """
-    resp = runpod.runpod.api.graphql.run_graphql_query(query)
-    pods = resp.get('data', {}).get('myself', {}).get('pods', [])
+def _list_pods_with_network_volume() -> List[Dict[str, Any]]:
+    """Lists all pods of the current user with their network volume id."""
+    resp = runpod.run_graphql_query(_QUERY_PODS_NETWORK_VOLUME)
+    return resp.get('data', {}).get('myself', {}).get('pods', [])
+
+
+def _get_usedby_from_pods(
+        vol_id: str, pods: List[Dict[str, Any]],
+        clusters: List[Dict[str, Any]]) -> Tuple[List[str], List[str]]:
+    """Filters pods by network volume id and maps them to cluster names."""
     used_pods = [p for p in pods if p.get('networkVolumeId') == vol_id]
-    usedby_pod_names = [p.get('name') for p in used_pods if p.get('name')]
+    usedby_pod_names: List[str] = [
+        p['name'] for p in used_pods if p.get('name')
+    ]
 
     # Map pod names back to SkyPilot cluster names using heuristics.
-    clusters = global_user_state.get_clusters()
     cluster_names: List[str] = []
     user_hash = common_utils.get_user_hash()
     for pod_name in usedby_pod_names:
@@ -158,16 +152,62 @@ def get_volume_usedby(
     return usedby_pod_names, cluster_names
 
 
+def get_volume_usedby(
+    config: models.VolumeConfig,) -> Tuple[List[str], List[str]]:
+    """Gets the clusters currently using this RunPod network volume.
+
+    Returns:
+      (usedby_pods, usedby_clusters)
+    usedby_clusters contains SkyPilot cluster display names inferred from
+      pod names, which may be wrong.
+    """
+    vol_id = config.id_on_cloud
+    name_on_cloud = config.name_on_cloud
+    if vol_id is None:
+        vol_id = _try_resolve_volume_id(name_on_cloud)
+    if vol_id is None:
+        return [], []
+
+    # Query all pods for current user and filter by networkVolumeId
+    pods = _list_pods_with_network_volume()
+    return _get_usedby_from_pods(vol_id, pods, global_user_state.get_clusters())
+
+
 def get_all_volumes_usedby(
     configs: List[models.VolumeConfig],
 ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-    """Gets the usedby resources of all volumes."""
-    used_by_results = [get_volume_usedby(config) for config in configs]
+    """Gets the usedby resources of all volumes.
+
+    The volume list, pod list and cluster list are fetched at most once and
+    shared by all volumes, instead of issuing the same queries per volume.
+    """
+    name_to_id: Optional[Dict[str, Optional[str]]] = None
+    pods: Optional[List[Dict[str, Any]]] = None
+    clusters: List[Dict[str, Any]] = []
     used_by_pods, used_by_clusters = {}, {}
-    for i in range(len(configs)):
-        config = configs[i]
-        used_by_pods[config.name_on_cloud] = used_by_results[i][0]
-        used_by_clusters[config.name_on_cloud] = used_by_results[i][1]
+    for config in configs:
+        vol_id = config.id_on_cloud
+        if vol_id is None:
+            if name_to_id is None:
+                name_to_id = {}
+                for vol in _list_volumes():
+                    name = vol.get('name')
+                    if name is None:
+                        continue
+                    # Keep the first match, same as _try_resolve_volume_id.
+                    name_to_id.setdefault(name, vol.get('id'))
+            vol_id = name_to_id.get(config.name_on_cloud)
+        if vol_id is None:
+            used_pods: List[str] = []
+            used_clusters: List[str] = []
+        else:
+            if pods is None:
+                pods = _list_pods_with_network_volume()
+                clusters = global_user_state.get_clusters()
+            used_pods, used_clusters = _get_usedby_from_pods(
+                vol_id, pods, clusters)
+        used_by_pods[config.name_on_cloud] = used_pods
+        used_by_clusters[config.name_on_cloud] = used_clusters
     return used_by_pods, used_by_clusters
 
 
@@ -17,6 +17,7 @@ import requests
 import sky
 from sky import global_user_state
 from sky import sky_logging
+from sky.adaptors import runpod
 from sky.backends.cloud_vm_ray_backend import CloudVmRayBackend
 from sky.catalog import vsphere_catalog
 from sky.provision import common as provision_common
@@ -612,3 +613,34 @@ def reset_global_state():
     """Reset global state before each test."""
     annotations.is_on_api_server = True
     yield
+
+
+class MockRunPodResponse:
+    """Minimal stand-in for the requests.Response the RunPod adaptor reads."""
+
+    def __init__(self,
+                 status_code=200,
+                 text='',
+                 json_obj=None,
+                 json_raises=False):
+        self.status_code = status_code
+        self.text = text
+        self.content = text.encode('utf-8')
+        self._json_obj = json_obj
+        self._json_raises = json_raises
+
+    def json(self):
+        if self._json_raises:
+            raise ValueError('not json')
+        return self._json_obj
+
+
+@pytest.fixture
+def runpod_no_credential_file(monkeypatch, tmp_path):
+    """Point the RunPod adaptor at a missing credential file.
+
+    Keeps a real ~/.runpod/config.toml on the test machine from taking
+    precedence over RUNPOD_API_KEY set by the test.
+    """
+    monkeypatch.setattr(runpod, '_CREDENTIAL_FILE',
+                        str(tmp_path / 'missing.toml'))
@@ -9,7 +9,6 @@ Each endpoint has its own test function for better pytest integration:
 import asyncio
 import os
 import pathlib
-import sys
 import tempfile
 import time
 from typing import Any, Callable, Dict
@@ -18,9 +17,6 @@ from unittest import mock
 import fastapi.exceptions
 import pytest
 
-# Add parent directory to path
-sys.path.insert(0, str(pathlib.Path(__file__).parent.parent.parent))
-
 from sky import global_user_state
 from sky.data import storage_utils
 from sky.server import server
@@ -0,0 +1,34 @@
+"""Tests for the RunPod provisioner."""
+from unittest.mock import MagicMock
+
+from sky.adaptors import runpod
+from sky.provision.runpod.api import commands
+
+
+def test_create_spot_pod_resolves_volume_data_center(monkeypatch):
+    sdk = MagicMock()
+    monkeypatch.setattr(runpod, 'sdk', lambda: sdk)
+    requested = []
+
+    def _rest_request(method, path, json=None):
+        requested.append((method, path))
+        return {'id': 'VID', 'dataCenterId': 'EU-RO-1'}
+
+    mutations = []
+
+    def _run_graphql_query(query):
+        mutations.append(query)
+        return {'data': {'podRentInterruptable': {'id': 'pod'}}}
+
+    monkeypatch.setattr(runpod, 'rest_request', _rest_request)
+    monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
+    pod = commands.create_spot_pod(name='n',
+                                   image_name='img',
+                                   gpu_type_id='gpu',
+                                   bid_per_gpu=0.3,
+                                   network_volume_id='VID')
+    assert pod == {'id': 'pod'}
+    assert requested == [('GET', '/networkvolumes/VID')]
+    assert 'dataCenterId: "EU-RO-1"' in mutations[0]
+    sdk.get_gpu.assert_called_once_with('gpu')
+    sdk.get_user.assert_not_called()
@@ -0,0 +1,143 @@
+"""Tests for RunPod adaptor."""
+import email.message
+import os
+import urllib.request
+
+from common_test_fixtures import MockRunPodResponse
+import pytest
+
+from sky.adaptors import runpod
+
+
+@pytest.mark.usefixtures('runpod_no_credential_file')
+class TestRunPodAdaptor:
+
+    def test_get_api_key_from_file(self, monkeypatch, tmp_path):
+        cred_file = tmp_path / 'config.toml'
+        cred_file.write_text('[default]\napi_key = "abc"\n')
+        monkeypatch.setattr(runpod, '_CREDENTIAL_FILE', str(cred_file))
+        monkeypatch.setenv('RUNPOD_API_KEY', 'envkey')
+        assert runpod._get_api_key() == 'abc'
+
+    def test_get_api_key_file_cached_until_modified(self, monkeypatch,
+                                                    tmp_path):
+        cred_file = tmp_path / 'config.toml'
+        cred_file.write_text('[default]\napi_key = "abc"\n')
+        monkeypatch.setattr(runpod, '_CREDENTIAL_FILE', str(cred_file))
+        parsed = []
+        real_loads = runpod.tomllib.loads
+
+        class _Tomllib:
+
+            @staticmethod
+            def loads(content):
+                parsed.append(content)
+                return real_loads(content)
+
+        monkeypatch.setattr(runpod, 'tomllib', _Tomllib)
+        assert runpod._get_api_key() == 'abc'
+        assert runpod._get_api_key() == 'abc'
+        assert len(parsed) == 1
+        cred_file.write_text('[default]\napi_key = "xyz1"\n')
+        assert runpod._get_api_key() == 'xyz1'
+        assert len(parsed) == 2
+
+    def test_get_api_key_file_rotated_to_same_length_key(
+            self, monkeypatch, tmp_path):
+        cred_file = tmp_path / 'config.toml'
+        cred_file.write_text('[default]\napi_key = "abc"\n')
+        monkeypatch.setattr(runpod, '_CREDENTIAL_FILE', str(cred_file))
+        assert runpod._get_api_key() == 'abc'
+        # Atomically replace the file with a same-length key and the same
+        # mtime, so only the inode and ctime tell the two versions apart.
+        old_stat = os.stat(cred_file)
+        new_file = tmp_path / 'config.toml.new'
+        new_file.write_text('[default]\napi_key = "xyz"\n')
+        os.utime(new_file, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns))
+        os.replace(new_file, cred_file)
+        assert runpod._get_api_key() == 'xyz'
+
+    def test_get_api_key_invalid_file_falls_back_to_env(self, monkeypatch,
+                                                        tmp_path):
+        cred_file = tmp_path / 'config.toml'
+        cred_file.write_text('[default\n')
+        monkeypatch.setattr(runpod, '_CREDENTIAL_FILE', str(cred_file))
+        monkeypatch.setenv('RUNPOD_API_KEY', 'envkey')
+        assert runpod._get_api_key() == 'envkey'
+
+    def test_sdk_uses_reloaded_api_key(self, monkeypatch, tmp_path):
+        cred_file = tmp_path / 'config.toml'
+        cred_file.write_text('[default]\napi_key = "old"\n')
+        monkeypatch.setattr(runpod, '_CREDENTIAL_FILE', str(cred_file))
+        module = runpod.runpod.load_module()
+        monkeypatch.setattr(module, 'api_key', None)
+        assert runpod.sdk().api_key == 'old'
+        # Simulate `runpod config --overwrite` with a new key.
+        cred_file.write_text('[default]\napi_key = "rotated"\n')
+        assert runpod.sdk().api_key == 'rotated'
+        assert module.api_key == 'rotated'
+
+    def test_session_shared_across_api_keys(self, monkeypatch):
+        monkeypatch.setattr(runpod, '_session', None)
+        session = runpod._get_session()
+        assert runpod._get_session() is session
+        assert 'Authorization' not in session.headers
+
+        sent_headers = []
+
+        class _Session:
+
+            @staticmethod
+            def request(method, url, headers=None, json=None, timeout=30):
+                sent_headers.append(headers)
+                return MockRunPodResponse(status_code=200)
+
+        monkeypatch.setattr(runpod, '_get_session', lambda: _Session)
+        for key, path in (('k1', '/a'), ('k2', '/b'), ('k1', '/c')):
+            monkeypatch.setenv('RUNPOD_API_KEY', key)
+            runpod.rest_request('GET', path)
+        assert [h['Authorization'] for h in sent_headers
+               ] == ['Bearer k1', 'Bearer k2', 'Bearer k1']
+        # Headers are built once per key.
+        assert sent_headers[0] is sent_headers[2]
+
+    def test_session_does_not_store_cookies(self, monkeypatch):
+        monkeypatch.setattr(runpod, '_session', None)
+        session = runpod._get_session()
+        headers = email.message.Message()
+        headers['Set-Cookie'] = 'sid=abc; Path=/'
+
+        class _RawResponse:
+
+            @staticmethod
+            def info():
+                return headers
+
+        session.cookies.extract_cookies(
+            _RawResponse(),
+            urllib.request.Request('https://api.runpod.io/graphql'))
+        assert len(session.cookies) == 0
+
+    def test_run_graphql_query_reuses_constant_query_body(self, monkeypatch):
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
+        monkeypatch.setattr(runpod, '_constant_query_bodies', {})
+        sent = []
+
+        class _Session:
+
+            @staticmethod
+            def post(url, headers=None, data=None, timeout=30):
+                sent.append(data)
+                return MockRunPodResponse(json_obj={'data': {'ok': True}})
+
+        monkeypatch.setattr(runpod, '_get_session', lambda: _Session)
+        query = runpod.constant_query('query { a }')
+        assert runpod.run_graphql_query(query) == {'data': {'ok': True}}
+        runpod.run_graphql_query(query)
+        assert sent[0] == b'{"query": "query { a }"}'
+        assert sent[0] is sent[1]
+
+        # One-off queries are encoded per call and not kept around.
+        runpod.run_graphql_query('mutation { b }')
+        assert sent[2] == b'{"query": "mutation { b }"}'
+        assert list(runpod._constant_query_bodies) == ['query { a }']
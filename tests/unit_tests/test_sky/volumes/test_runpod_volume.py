@@ -1,6 +1,7 @@
 """Test RunPod network volume."""
 from unittest.mock import MagicMock
 
+from common_test_fixtures import MockRunPodResponse
 import pytest
 
 from sky.adaptors import runpod
@@ -190,24 +191,10 @@ class TestRunPodVolume:
         volume_lib.Volume.from_yaml_config(ok_cfg)
 
 
+@pytest.mark.usefixtures('runpod_no_credential_file')
 class TestRunPodProvisionVolume:
 
-    class _Resp:
-
-        def __init__(self,
-                     status_code=200,
-                     text='',
-                     json_obj=None,
-                     json_raises=False):
-            self.status_code = status_code
-            self.text = text
-            self._json_obj = json_obj
-            self._json_raises = json_raises
-
-        def json(self):
-            if self._json_raises:
-                raise ValueError('not json')
-            return self._json_obj
+    _Resp = MockRunPodResponse
 
     def _mock_requests(self, monkeypatch, response):
 
@@ -217,41 +204,20 @@ class TestRunPodProvisionVolume:
             def request(method, url, headers=None, json=None, timeout=30):
                 return response
 
-        monkeypatch.setattr(runpod, 'requests', _Req)
-
-    def test_get_api_key_from_sdk(self, monkeypatch):
-
-        class _SDK:
-            api_key = 'abc'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
-        assert runpod._get_api_key() == 'abc'
+        monkeypatch.setattr(runpod, '_get_session', lambda: _Req)
 
     def test_get_api_key_from_env(self, monkeypatch):
-
-        class _SDK:
-            api_key = None
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
         monkeypatch.setenv('RUNPOD_API_KEY', 'envkey')
         assert runpod._get_api_key() == 'envkey'
 
     def test_get_api_key_missing_raises(self, monkeypatch):
-
-        class _SDK:
-            api_key = None
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
         monkeypatch.delenv('RUNPOD_API_KEY', raising=False)
         with pytest.raises(RuntimeError):
             _ = runpod._get_api_key()
 
     def test_rest_request_success_json(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
         resp = self._Resp(status_code=200,
                           text='{"foo":1}',
                           json_obj={'foo': 1})
@@ -261,10 +227,7 @@ class TestRunPodProvisionVolume:
 
     def test_rest_request_success_plain_text(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
         resp = self._Resp(status_code=200, text='ok', json_raises=True)
         self._mock_requests(monkeypatch, resp)
         out = runpod.rest_request('GET', '/ping')
@@ -272,10 +235,7 @@ class TestRunPodProvisionVolume:
 
     def test_rest_request_no_text(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
         resp = self._Resp(status_code=200, text='')
         self._mock_requests(monkeypatch, resp)
         out = runpod.rest_request('DELETE', '/networkvolumes/x')
@@ -283,10 +243,7 @@ class TestRunPodProvisionVolume:
 
     def test_rest_request_error_raises(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
         resp = self._Resp(status_code=500, text='boom')
         self._mock_requests(monkeypatch, resp)
         with pytest.raises(RuntimeError):
@@ -294,10 +251,7 @@ class TestRunPodProvisionVolume:
 
     def test_rest_request_retries_then_success_5xx(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
 
         class SeqReq:
             calls = 0
@@ -314,17 +268,14 @@ class TestRunPodProvisionVolume:
                 SeqReq.calls += 1
                 return SeqReq.seq[min(SeqReq.calls - 1, len(SeqReq.seq) - 1)]
 
-        monkeypatch.setattr(runpod, 'requests', SeqReq)
+        monkeypatch.setattr(runpod, '_get_session', lambda: SeqReq)
         out = runpod.rest_request('GET', '/retry')
         assert out == {'ok': True}
         assert SeqReq.calls == 3
 
     def test_rest_request_network_error_then_success(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
 
         class NetSeqReq:
             calls = 0
@@ -338,17 +289,14 @@ class TestRunPodProvisionVolume:
                                                        text='{"v":1}',
                                                        json_obj={'v': 1})
 
-        monkeypatch.setattr(runpod, 'requests', NetSeqReq)
+        monkeypatch.setattr(runpod, '_get_session', lambda: NetSeqReq)
         out = runpod.rest_request('GET', '/net')
         assert out == {'v': 1}
         assert NetSeqReq.calls == 2
 
     def test_rest_request_network_error_exhaustion(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
 
         class AlwaysNetErr:
             calls = 0
@@ -358,17 +306,14 @@ class TestRunPodProvisionVolume:
                 AlwaysNetErr.calls += 1
                 raise RuntimeError('net')
 
-        monkeypatch.setattr(runpod, 'requests', AlwaysNetErr)
+        monkeypatch.setattr(runpod, '_get_session', lambda: AlwaysNetErr)
         with pytest.raises(RuntimeError):
             _ = runpod.rest_request('GET', '/net-exhaust')
         assert AlwaysNetErr.calls == runpod._MAX_RETRIES
 
     def test_rest_request_retry_exhaustion_5xx(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
 
         class Always500:
             calls = 0
@@ -379,17 +324,14 @@ class TestRunPodProvisionVolume:
                 return TestRunPodProvisionVolume._Resp(status_code=500,
                                                        text='boom')
 
-        monkeypatch.setattr(runpod, 'requests', Always500)
+        monkeypatch.setattr(runpod, '_get_session', lambda: Always500)
         with pytest.raises(RuntimeError):
             _ = runpod.rest_request('GET', '/exhaust')
         assert Always500.calls == runpod._MAX_RETRIES
 
     def test_rest_request_non_retryable_4xx_single_attempt(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
 
         class Always400:
             calls = 0
@@ -400,17 +342,14 @@ class TestRunPodProvisionVolume:
                 return TestRunPodProvisionVolume._Resp(status_code=400,
                                                        text='bad')
 
-        monkeypatch.setattr(runpod, 'requests', Always400)
+        monkeypatch.setattr(runpod, '_get_session', lambda: Always400)
         with pytest.raises(RuntimeError):
             _ = runpod.rest_request('GET', '/bad')
         assert Always400.calls == 1
 
     def test_list_volumes_variants(self, monkeypatch):
 
-        class _SDK:
-            api_key = 'k'
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _SDK)
+        monkeypatch.setenv('RUNPOD_API_KEY', 'k')
         # direct list
         self._mock_requests(monkeypatch, self._Resp(200,
                                                     text='[ ]',
@@ -597,31 +536,24 @@ class TestRunPodProvisionVolume:
             name_on_cloud = 'vol'
 
         # Mock GraphQL response
-        class _API:
-
-            class api:
-
-                class graphql:
-
-                    @staticmethod
-                    def run_graphql_query(query):
-                        return {
-                            'data': {
-                                'myself': {
-                                    'pods': [{
-                                        'id': 'p1',
-                                        'name': 'cluster-a-user-hash-head',
-                                        'networkVolumeId': 'VID'
-                                    }, {
-                                        'id': 'p2',
-                                        'name': 'other',
-                                        'networkVolumeId': 'X'
-                                    }]
-                                }
-                            }
-                        }
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _API)
+        def _run_graphql_query(query):
+            return {
+                'data': {
+                    'myself': {
+                        'pods': [{
+                            'id': 'p1',
+                            'name': 'cluster-a-user-hash-head',
+                            'networkVolumeId': 'VID'
+                        }, {
+                            'id': 'p2',
+                            'name': 'other',
+                            'networkVolumeId': 'X'
+                        }]
+                    }
+                }
+            }
+
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
         # Mock clusters
         monkeypatch.setattr(
             'sky.global_user_state.get_clusters', lambda: [{
@@ -642,31 +574,24 @@ class TestRunPodProvisionVolume:
             name_on_cloud = 'vol'
 
         # Mock GraphQL response
-        class _API:
-
-            class api:
-
-                class graphql:
-
-                    @staticmethod
-                    def run_graphql_query(query):
-                        return {
-                            'data': {
-                                'myself': {
-                                    'pods': [{
-                                        'id': 'p1',
-                                        'name': 'cluster-a-user-hash-head',
-                                        'networkVolumeId': 'VID'
-                                    }, {
-                                        'id': 'p2',
-                                        'name': 'other',
-                                        'networkVolumeId': 'X'
-                                    }]
-                                }
-                            }
-                        }
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _API)
+        def _run_graphql_query(query):
+            return {
+                'data': {
+                    'myself': {
+                        'pods': [{
+                            'id': 'p1',
+                            'name': 'cluster-a-user-hash-head',
+                            'networkVolumeId': 'VID'
+                        }, {
+                            'id': 'p2',
+                            'name': 'other',
+                            'networkVolumeId': 'X'
+                        }]
+                    }
+                }
+            }
+
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
         # Mock clusters
         monkeypatch.setattr(
             'sky.global_user_state.get_clusters', lambda: [{
@@ -683,6 +608,65 @@ class TestRunPodProvisionVolume:
         assert used_pods == ['cluster-a-user-hash-head']
         assert used_clusters == ['cluster-a']
 
+    def test_get_all_volumes_usedby_queries_once(self, monkeypatch):
+
+        class Cfg:
+
+            def __init__(self, name, vid):
+                self.name_on_cloud = name
+                self.id_on_cloud = vid
+
+        calls = {'graphql': 0, 'list': 0}
+
+        def _run_graphql_query(query):
+            calls['graphql'] += 1
+            return {
+                'data': {
+                    'myself': {
+                        'pods': [{
+                            'id': 'p1',
+                            'name': 'cluster-a-user-hash-head',
+                            'networkVolumeId': 'VID1'
+                        }, {
+                            'id': 'p2',
+                            'name': 'cluster-b-user-hash-head',
+                            'networkVolumeId': 'VID2'
+                        }]
+                    }
+                }
+            }
+
+        def _list_volumes():
+            calls['list'] += 1
+            return [{'id': 'VID2', 'name': 'v2'}, {'id': 'VID3', 'name': 'v3'}]
+
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
+        monkeypatch.setattr(runpod_prov, '_list_volumes', _list_volumes)
+        monkeypatch.setattr(
+            'sky.global_user_state.get_clusters', lambda: [{
+                'name': 'cluster-a'
+            }, {
+                'name': 'cluster-b'
+            }])
+        monkeypatch.setattr('sky.utils.common_utils.get_user_hash',
+                            lambda: 'user-hash')
+        configs = [
+            Cfg('v1', 'VID1'),
+            Cfg('v2', None),
+            Cfg('v3', None),
+            Cfg('missing', None)
+        ]
+        used_pods, used_clusters = runpod_prov.get_all_volumes_usedby(configs)
+        assert used_pods == {
+            'v1': ['cluster-a-user-hash-head'],
+            'v2': ['cluster-b-user-hash-head'],
+            'v3': [],
+            'missing': [],
+        }
+        assert used_clusters['v1'] == ['cluster-a']
+        assert used_clusters['v2'] == ['cluster-b']
+        assert calls == {'graphql': 1, 'list': 1}
+
     def test_get_volume_usedby_resolve_id_missing_graphql_keys(
             self, monkeypatch):
 
@@ -693,17 +677,10 @@ class TestRunPodProvisionVolume:
         monkeypatch.setattr(runpod_prov, '_try_resolve_volume_id',
                             lambda name: 'VIDX')
 
-        class _API:
-
-            class api:
-
-                class graphql:
-
-                    @staticmethod
-                    def run_graphql_query(query):
-                        return {}  # missing keys -> defaults to []
+        def _run_graphql_query(query):
+            return {}  # missing keys -> defaults to []
 
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _API)
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
         used_pods, used_clusters = runpod_prov.get_volume_usedby(Cfg())
         assert used_pods == [] and used_clusters == []
 
@@ -713,54 +690,47 @@ class TestRunPodProvisionVolume:
             id_on_cloud = 'VID'
             name_on_cloud = 'vol'
 
-        class _API:
-
-            class api:
-
-                class graphql:
-
-                    @staticmethod
-                    def run_graphql_query(query):
-                        return {
-                            'data': {
-                                'myself': {
-                                    'pods': [
-                                        {
-                                            'id': 'p1',
-                                            'name': None,
-                                            'networkVolumeId': 'VID'
-                                        },
-                                        {
-                                            'id': 'p2',
-                                            'name': '',
-                                            'networkVolumeId': 'VID'
-                                        },
-                                        {
-                                            'id': 'p3',
-                                            'name': 'cluster-a-user-hash-worker',
-                                            'networkVolumeId': 'VID'
-                                        },
-                                        {
-                                            'id': 'p4',
-                                            'name': 'cluster-a-b-user-hash-head',
-                                            'networkVolumeId': 'VID'
-                                        },  # equality match
-                                        {
-                                            'id': 'p5',
-                                            'name': 'cluster-a-user-hash-head',
-                                            'networkVolumeId': 'VID'
-                                        },
-                                        {
-                                            'id': 'p6',
-                                            'name': 'other',
-                                            'networkVolumeId': 'X'
-                                        }
-                                    ]
-                                }
+        def _run_graphql_query(query):
+            return {
+                'data': {
+                    'myself': {
+                        'pods': [
+                            {
+                                'id': 'p1',
+                                'name': None,
+                                'networkVolumeId': 'VID'
+                            },
+                            {
+                                'id': 'p2',
+                                'name': '',
+                                'networkVolumeId': 'VID'
+                            },
+                            {
+                                'id': 'p3',
+                                'name': 'cluster-a-user-hash-worker',
+                                'networkVolumeId': 'VID'
+                            },
+                            {
+                                'id': 'p4',
+                                'name': 'cluster-a-b-user-hash-head',
+                                'networkVolumeId': 'VID'
+                            },  # equality match
+                            {
+                                'id': 'p5',
+                                'name': 'cluster-a-user-hash-head',
+                                'networkVolumeId': 'VID'
+                            },
+                            {
+                                'id': 'p6',
+                                'name': 'other',
+                                'networkVolumeId': 'X'
                             }
-                        }
+                        ]
+                    }
+                }
+            }
 
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _API)
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
         monkeypatch.setattr(
             'sky.global_user_state.get_clusters', lambda: [{
                 'name': 'cluster-a'
@@ -786,27 +756,20 @@ class TestRunPodProvisionVolume:
             id_on_cloud = 'VID'
             name_on_cloud = 'vol'
 
-        class _API:
-
-            class api:
-
-                class graphql:
-
-                    @staticmethod
-                    def run_graphql_query(query):
-                        return {
-                            'data': {
-                                'myself': {
-                                    'pods': [{
-                                        'id': 'p1',
-                                        'name': 'c1-head',
-                                        'networkVolumeId': 'VID'
-                                    },]
-                                }
-                            }
-                        }
-
-        monkeypatch.setattr('sky.adaptors.runpod.runpod', _API)
+        def _run_graphql_query(query):
+            return {
+                'data': {
+                    'myself': {
+                        'pods': [{
+                            'id': 'p1',
+                            'name': 'c1-head',
+                            'networkVolumeId': 'VID'
+                        },]
+                    }
+                }
+            }
+
+        monkeypatch.setattr(runpod, 'run_graphql_query', _run_graphql_query)
         monkeypatch.setattr('sky.global_user_state.get_clusters', lambda: [])
         used_pods, used_clusters = runpod_prov.get_volume_usedby(Cfg())
         assert used_pods == ['c1-head']